@@ -71,18 +71,13 @@ if (Get-Command rg -ErrorAction SilentlyContinue) {
     exit $exitCode
 }
 
-$hits = @()
 $files = Get-ChildItem -Path $Root -Recurse -File -ErrorAction SilentlyContinue |
     Where-Object {
         $_.FullName -notmatch $excludePathRegex
     }
 
-foreach ($pattern in $patterns) {
-    $matches = $files | Select-String -Pattern $pattern -ErrorAction SilentlyContinue
-    if ($matches) {
-        $hits += $matches
-    }
-}
+# Single pass over the tree: Select-String checks every pattern per line.
+$hits = @($files | Select-String -Pattern $patterns -ErrorAction SilentlyContinue)
 
 if ($hits.Count -gt 0) {
     $filteredHits = $hits | Where-Object {